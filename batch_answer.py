@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+키워드 엔진 일괄 답변 (오프라인 커버리지 점검)
+실제 수강생 질문 CSV를 키워드 경로(find_best_match + find_related_questions_smart)로 한 번에 채점하여
+점수, 매칭 키워드, 질의별 처리 시간을 CSV/JSONL로 저장합니다.
+카탈로그는 한 번만 불러오고, 질문은 프로세스 풀에 나눠 처리합니다.
+워커는 fork 방식으로 명시해 만들어 부모의 카탈로그를 복사 없이 공유하고, fork를 쓸 수 없는 플랫폼(Windows)에서는
+spawn으로 만든 각 워커가 init_worker에서 카탈로그를 직접 불러옵니다.
+똑같은 질문이 여러 번 나오면 한 번만 채점합니다.
+
+사용법:
+    python batch_answer.py questions.csv --output answers.csv
+    python batch_answer.py questions.csv --output answers.jsonl --column 질문 --workers 8 --db
+    python batch_answer.py questions.csv --output answers.csv --no-header
+"""
+
+import argparse
+import csv
+import gc
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+
+# 이 프로세스가 직접 채점하므로 사이드카 클라이언트 모드는 끔
+os.environ["USE_RETRIEVAL_SERVICE"] = "false"
+
+import main
+
+# CSV 출력 열 (목록 값은 "|"로 연결)
+OUTPUT_FIELDS = [
+    "row", "question", "best_id", "best_question", "best_score", "matched_keywords",
+    "related_ids", "related_scores", "top_related_id", "top_related_score",
+    "intent", "topic", "elapsed_ms"
+]
+
+# 워커 프로세스에서 쓰는 채점 옵션 (init_worker에서 설정)
+options = {}
+
+def init_worker(limit: int, min_score: float, load_catalog: bool, use_db: bool):
+    """워커 초기화. load_catalog이면 (fork가 아닌 경우) 부모와 같은 QA 카탈로그를 이 프로세스에서 불러옵니다."""
+    logging.disable(logging.INFO)
+    options.update(limit=limit, min_score=min_score)
+    if load_catalog and use_db:
+        main.load_qa_catalog_from_db()
+
+def worker_context():
+    """워커 프로세스 시작 방식 (기본값이 spawn인 macOS 등에서도 가능하면 fork를 명시적으로 사용)"""
+    method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+def answer_question(question: str) -> dict:
+    """질문 하나를 find_best_match + find_related_questions_smart와 같은 방식으로 채점합니다.
+
+    두 함수 모두 retrieve_qa를 쓰므로, 정규화된 검색어가 find_best_match의 입력과 같으면
+    (대부분의 질문) 한 번의 retrieve_qa 결과를 함께 사용합니다. 최적 답변은 limit/min_score와 무관합니다.
+    """
+    start = time.perf_counter()
+    normalized = main.normalize_query(question)
+    related = main.retrieve_qa(normalized, options["limit"], options["min_score"])
+    best = related if normalized == question.lower().strip() else main.retrieve_qa(question)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return {
+        "question": question,
+        "best_id": best.best_id,
+        "best_question": best.best_match["question"] if best.best_match else None,
+        "best_score": round(best.best_score, 2),
+        "matched_keywords": best.matched_keywords,
+        "related_ids": [r["id"] for r in related.related_questions],
+        "related_scores": [r["score"] for r in related.related_questions],
+        "top_related_id": related.related_questions[0]["id"] if related.related_questions else None,
+        "top_related_score": related.related_questions[0]["score"] if related.related_questions else None,
+        "intent": related.intent["intent"],
+        "topic": related.intent["topic"],
+        "elapsed_ms": round(elapsed_ms, 3)
+    }
+
+def read_questions(path: str, column: str, no_header: bool = False) -> list:
+    """CSV에서 질문 목록을 읽습니다.
+
+    첫 줄을 헤더로 보고 column 열을 읽으며, 헤더에 column이 없으면 ValueError를 냅니다.
+    no_header이면 헤더 없이 모든 줄의 첫 번째 열을 질문으로 읽습니다.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        if no_header:
+            index, rows = 0, reader
+        else:
+            header = next(reader, [])
+            if column not in header:
+                raise ValueError(f"질문 열 '{column}'이(가) 없습니다. 사용 가능한 열: {', '.join(header) or '(없음)'} "
+                                 f"(헤더가 없는 파일은 --no-header)")
+            index, rows = header.index(column), reader
+        return [row[index].strip() for row in rows if len(row) > index and row[index].strip()]
+
+class ResultWriter:
+    """결과를 CSV 또는 JSONL로 기록합니다."""
+
+    def __init__(self, path: str, output_format: str):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.output_format = output_format
+        if output_format == "csv":
+            self.writer = csv.DictWriter(self.file, fieldnames=OUTPUT_FIELDS)
+            self.writer.writeheader()
+
+    def write(self, result: dict):
+        if self.output_format == "jsonl":
+            self.file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        else:
+            self.writer.writerow({
+                key: "|".join(str(v) for v in value) if isinstance(value, list) else value
+                for key, value in result.items()
+            })
+
+    def close(self):
+        self.file.close()
+
+def percentile(values: list, ratio: float) -> float:
+    return values[min(int(len(values) * ratio), len(values) - 1)] if values else 0.0
+
+def run():
+    parser = argparse.ArgumentParser(description="키워드 엔진 일괄 답변 (CSV -> CSV/JSONL)")
+    parser.add_argument("input", help="질문 CSV 파일")
+    parser.add_argument("--output", required=True, help="결과 파일 (.csv 또는 .jsonl)")
+    parser.add_argument("--column", default="question", help="질문 열 이름")
+    parser.add_argument("--no-header", action="store_true", help="헤더 없는 CSV (첫 번째 열을 질문으로 사용)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="결과 형식 (기본: 출력 파일 확장자)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="프로세스 수")
+    parser.add_argument("--limit", type=int, default=5, help="관련 질문 개수")
+    parser.add_argument("--min-score", type=float, default=0.5, help="관련 질문 최소 점수")
+    parser.add_argument("--chunk-size", type=int, default=256, help="프로세스에 한 번에 넘길 질문 수")
+    parser.add_argument("--db", action="store_true", help="코드 기본 QA 대신 DB의 QA 카탈로그 사용")
+    args = parser.parse_args()
+
+    output_format = args.format or ("jsonl" if args.output.endswith(".jsonl") else "csv")
+    try:
+        questions = read_questions(args.input, args.column, args.no_header)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if not questions:
+        print(f"❌ 질문이 없습니다: {args.input}")
+        sys.exit(1)
+
+    logging.disable(logging.INFO)
+    start = time.perf_counter()
+    if args.db:
+        main.load_qa_catalog_from_db()
+    # 지연 생성되는 색인은 fork 전에 만들어 두어 워커가 각자 만들지 않게 함
+    main.qa_catalog.topic_shards()
+    if main.RETRIEVAL_ANN_MODE:
+        main.qa_catalog.ann_index()
+    # fork 후 GC가 카탈로그 객체를 건드려 페이지가 복사되지 않도록 고정
+    gc.freeze()
+    print(f"📚 QA 카탈로그 {len(main.qa_catalog.entries)}개 준비: {time.perf_counter() - start:.1f}s")
+
+    writer = ResultWriter(args.output, output_format)
+    elapsed, best_hits, related_hits = [], 0, 0
+    start = time.perf_counter()
+    unique_questions = list(dict.fromkeys(questions))
+    context = worker_context()
+    load_catalog = context.get_start_method() != "fork"
+    with context.Pool(args.workers, initializer=init_worker,
+                      initargs=(args.limit, args.min_score, load_catalog, args.db)) as pool:
+        results = dict(zip(unique_questions,
+                           pool.imap(answer_question, unique_questions, chunksize=args.chunk_size)))
+    for row, question in enumerate(questions):
+        result = {"row": row, **results[question]}
+        writer.write(result)
+        elapsed.append(result["elapsed_ms"])
+        best_hits += result["best_id"] is not None
+        related_hits += bool(result["related_ids"])
+    writer.close()
+    wall = time.perf_counter() - start
+
+    elapsed.sort()
+    total = len(questions)
+    print(f"✅ {total}개 질문 처리 (중복 제외 {len(unique_questions)}개): {wall:.1f}s "
+          f"({total / wall:,.0f}개/s, 프로세스 {args.workers}개)")
+    print(f"   최적 답변 매칭: {best_hits}개 ({best_hits / total:.1%})")
+    print(f"   관련 질문 있음: {related_hits}개 ({related_hits / total:.1%})")
+    print(f"   질의당 처리 시간: p50 {percentile(elapsed, 0.5):.2f}ms  p95 {percentile(elapsed, 0.95):.2f}ms  "
+          f"max {elapsed[-1]:.2f}ms")
+    print(f"💾 결과 저장: {args.output} ({output_format})")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+ANN 후보 검색 벤치마크
+QA_DATABASE 질문을 변형해 대규모 FAQ 카탈로그를 만든 뒤, 정확한 n-gram TF-IDF 유사도와
+LSH 후보 검색(RETRIEVAL_ANN_MODE)의 재현율과 질의당 지연 시간을 비교합니다.
+
+사용법:
+    python benchmark_ann.py --size 20000 --queries 300 --k 10 --candidates 200
+"""
+
+import argparse
+import logging
+import random
+import time
+
+import numpy as np
+
+import main
+
+def build_catalog(size: int, rng: random.Random) -> dict:
+    """기존 QA를 섞고 변형해 size개 항목의 가상 카탈로그를 만듭니다."""
+    base = list(main.QA_DATABASE.values())
+    words = [word for qa in base for word in qa["question"].split()]
+    catalog = {}
+    for i in range(size):
+        qa = base[i % len(base)]
+        question_words = qa["question"].split()
+        # 단어 일부를 빼고 다른 질문의 단어를 섞어 서로 다른 질문으로 만듦
+        kept = [w for w in question_words if rng.random() > 0.25] or question_words[:1]
+        question = " ".join(kept + rng.sample(words, rng.randint(1, 4)))
+        catalog[f"bench_{i}"] = {
+            "keywords": [f"bench{i}"] + qa["keywords"][:2],
+            "question": question,
+            "answer": qa["answer"]
+        }
+    return catalog
+
+def make_query(question: str, rng: random.Random) -> str:
+    """질문의 일부만 남기고 오타를 섞은 검색어"""
+    words = question.split()
+    start = rng.randrange(len(words))
+    query = " ".join(words[start:start + rng.randint(2, 5)])
+    if len(query) > 3 and rng.random() < 0.5:
+        i = rng.randrange(len(query))
+        query = query[:i] + query[i + 1:]
+    return query
+
+def measure(function, queries):
+    """질의당 평균 지연 시간(ms)과 결과 목록"""
+    start = time.perf_counter()
+    results = [function(query) for query in queries]
+    return (time.perf_counter() - start) * 1000 / len(queries), results
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description="ANN 후보 검색 재현율/지연 시간 벤치마크")
+    parser.add_argument("--size", type=int, default=20000, help="가상 카탈로그 QA 개수")
+    parser.add_argument("--queries", type=int, default=300, help="질의 개수")
+    parser.add_argument("--k", type=int, default=10, help="재현율을 잴 상위 개수")
+    parser.add_argument("--candidates", type=int, default=main.ANN_CANDIDATES, help="ANN 후보 개수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+
+    print(f"📚 가상 카탈로그 {args.size}개 구성 중...")
+    start = time.perf_counter()
+    catalog = main.QACatalog(build_catalog(args.size, rng))
+    print(f"   카탈로그 컴파일: {time.perf_counter() - start:.1f}s")
+    start = time.perf_counter()
+    ann = catalog.ann_index()
+    print(f"   ANN 색인 구성: {time.perf_counter() - start:.1f}s")
+
+    questions = [catalog.entries[qa_id]["question_lower"] for qa_id in catalog.qa_ids]
+    queries = [make_query(rng.choice(questions), rng) for _ in range(args.queries)]
+    similarity = catalog.similarity
+
+    # 1. 유사도 상위 k개 재현율
+    exact_ms, exact_scores = measure(lambda q: similarity.similarity(q, "question"), queries)
+    ann_ms, ann_rows = measure(lambda q: ann.query(q, args.candidates), queries)
+    rerank_ms, rerank_scores = measure(
+        lambda q: similarity.similarity_rows(q, "question", ann.query(q, args.candidates)), queries
+    )
+    recalls, rerank_recalls = [], []
+    for scores, rows, reranked in zip(exact_scores, ann_rows, rerank_scores):
+        top = set(np.argsort(-scores, kind="stable")[:args.k].tolist())
+        top = {row for row in top if scores[row] > 0}
+        if not top:
+            continue
+        recalls.append(len(top & set(rows.tolist())) / len(top))
+        reranked_top = set(np.argsort(-reranked, kind="stable")[:args.k].tolist())
+        rerank_recalls.append(len(top & reranked_top) / len(top))
+
+    print(f"\n🔍 질문 유사도 상위 {args.k}개 기준 (질의 {len(recalls)}개, 후보 {args.candidates}개)")
+    print(f"   정확한 유사도 계산:        {exact_ms:7.2f} ms/질의")
+    print(f"   LSH 후보 검색:            {ann_ms:7.2f} ms/질의  재현율 {np.mean(recalls):.3f}")
+    print(f"   LSH 후보 + 정확한 재채점:  {rerank_ms:7.2f} ms/질의  재현율 {np.mean(rerank_recalls):.3f}")
+
+    # 2. 관련 질문 전체 파이프라인 (find_related_questions_smart와 같은 retrieve_qa)
+    original_catalog, original_mode = main.qa_catalog, main.RETRIEVAL_ANN_MODE
+    main.qa_catalog = catalog
+    try:
+        main.RETRIEVAL_ANN_MODE = False
+        exact_ms, exact_related = measure(lambda q: main.retrieve_qa(q, 5, 0.5).related_questions, queries)
+        main.RETRIEVAL_ANN_MODE = True
+        ann_ms, ann_related = measure(lambda q: main.retrieve_qa(q, 5, 0.5).related_questions, queries)
+    finally:
+        main.qa_catalog, main.RETRIEVAL_ANN_MODE = original_catalog, original_mode
+    overlap = [
+        len({r["id"] for r in a} & {r["id"] for r in b}) / len(a)
+        for a, b in zip(exact_related, ann_related) if a
+    ]
+    same_top1 = np.mean([bool(a) and bool(b) and a[0]["id"] == b[0]["id"] for a, b in zip(exact_related, ann_related)])
+    print(f"\n💬 retrieve_qa 관련 질문 상위 5개")
+    print(f"   정확 모드: {exact_ms:7.2f} ms/질의")
+    print(f"   ANN 모드:  {ann_ms:7.2f} ms/질의  상위 5개 일치율 {np.mean(overlap):.3f}  1위 일치율 {same_top1:.3f}")
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+QA 카탈로그 스냅샷 빌드
+코드에 정의된 QA와 (연결 가능하면) DB의 QA로 검색 카탈로그를 컴파일하여 스냅샷 파일로 저장합니다.
+서버 워커는 시작할 때 같은 QA 데이터/코드로 만든 스냅샷을 메모리 매핑해 읽으므로 색인을 다시 만들지 않습니다.
+CATALOG_SNAPSHOT_KEY를 설정하면 서명한 스냅샷만 쓰이므로, 빌드 단계와 서버에 같은 키를 설정합니다.
+
+사용법 (배포 빌드 단계):
+    python build_catalog_snapshot.py
+    python build_catalog_snapshot.py --skip-db
+"""
+
+import argparse
+import logging
+import os
+
+import main
+
+def build_snapshots():
+    parser = argparse.ArgumentParser(description="QA 카탈로그 스냅샷 빌드")
+    parser.add_argument("--skip-db", action="store_true", help="DB의 QA는 빌드하지 않음")
+    args = parser.parse_args()
+
+    if not main.CATALOG_SNAPSHOT:
+        print("⚠️ CATALOG_SNAPSHOT=false 이므로 스냅샷을 만들지 않습니다.")
+        return
+
+    logging.getLogger("main").setLevel(logging.WARNING)
+    fingerprints = [("코드 기본 QA", main.catalog_fingerprint(main.QA_DATABASE))]
+
+    # main을 불러올 때 코드 기본 QA 카탈로그는 이미 컴파일/저장됨
+    if not args.skip_db:
+        try:
+            main.load_qa_catalog_from_db()
+            fingerprints.append(("DB QA", main.catalog_fingerprint(main.QA_DATABASE)))
+        except Exception as e:
+            print(f"⚠️ DB QA 스냅샷 건너뜀: {e}")
+
+    print(f"📦 스냅샷 디렉터리: {main.CATALOG_SNAPSHOT_DIR}")
+    for label, fingerprint in fingerprints:
+        path = main.catalog_snapshot_path(fingerprint)
+        if os.path.exists(path):
+            print(f"   ✅ {label}: {os.path.basename(path)} ({os.path.getsize(path) / 1024 / 1024:.1f}MB)")
+        else:
+            print(f"   ❌ {label}: 저장 실패")
+
+if __name__ == "__main__":
+    build_snapshots()
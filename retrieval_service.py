@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+검색 사이드카 (retrieval service)
+QA 카탈로그와 모든 검색 색인(키워드 오토마톤, n-gram 행렬, 이웃 목록, 자동완성 트라이)을
+이 프로세스 하나만 만들어 두고, API 워커의 채점 요청을 유닉스 소켓으로 처리합니다.
+QA 목록과 카탈로그 버전은 공유 메모리에 읽기 전용 스냅샷으로 게시합니다.
+(컴파일된 색인 배열은 공유하지 않습니다. 채점은 모두 이 프로세스가 하므로 워커는 QA 조회에 필요한
+QA 목록만 공유 메모리에서 읽고, 색인은 이 프로세스에 한 벌만 있습니다.)
+요청은 스레드 풀에서 처리하므로 DB를 읽는 sync나 오래 걸리는 채점이 다른 워커의 요청을 막지 않습니다.
+
+사용법:
+    python retrieval_service.py --socket /tmp/lionhelper-retrieval.sock
+    USE_RETRIEVAL_SERVICE=true uvicorn main:app --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import threading
+
+# 이 프로세스가 직접 채점하므로 사이드카 클라이언트 모드는 끔
+os.environ["USE_RETRIEVAL_SERVICE"] = "false"
+
+import main
+
+logger = logging.getLogger("retrieval_service")
+
+def retrieve(query: str, limit: int, min_score: float, context_keywords=None) -> dict:
+    """retrieve_qa 결과 중 워커가 쓰는 부분"""
+    result = main.retrieve_qa(query, limit, min_score, context_keywords)
+    return {
+        "best_match": result.best_match,
+        "best_id": result.best_id,
+        "best_score": result.best_score,
+        "matched_keywords": result.matched_keywords,
+        "related_questions": result.related_questions
+    }
+
+def neighbours(qa_id: str, exclude: list, limit: int, preview_length: int) -> list:
+    return main.neighbour_related_questions(qa_id, set(exclude), limit, preview_length)
+
+def status() -> dict:
+    return {
+        "version": main.qa_catalog.version,
+        "synced_version": main.qa_catalog.synced_version,
+        "qa_count": len(main.qa_catalog.entries),
+        "feedback_version": main.feedback_boosts.version,
+        "search_cache": main.search_cache.stats()
+    }
+
+OPERATIONS = {
+    "retrieve": retrieve,
+    "search": main.search_qa_cached,
+    "batch_search": main.batch_search,
+    "neighbours": neighbours,
+    "suggest": main.suggestion_index.suggest,
+    "record_query": main.suggestion_index.record_query,
+    "keyword_counts": main.count_catalog_keywords,
+    "status": status
+}
+
+class RetrievalServer:
+    """유닉스 소켓 검색 서버 + 공유 메모리 카탈로그 게시"""
+
+    def __init__(self, socket_path: str, shared_memory_name: str):
+        self.socket_path = socket_path
+        self.snapshot = main.SharedCatalogSnapshot(shared_memory_name)
+        self.published_version = None
+        self.database_loaded = False
+        self.sync_lock = threading.Lock()  # 주기적 동기화와 워커가 요청한 동기화가 겹치지 않도록
+
+    def publish(self):
+        """카탈로그가 바뀌었으면 공유 메모리 스냅샷을 갱신합니다."""
+        with main.qa_catalog.lock:
+            if main.qa_catalog.version == self.published_version:
+                return
+            self.snapshot.publish(main.qa_catalog)
+            self.published_version = main.qa_catalog.version
+        logger.info(f"QA 카탈로그 스냅샷 게시: 버전 {self.published_version}, {len(main.qa_catalog.entries)}개")
+
+    def sync(self) -> dict:
+        with self.sync_lock:
+            if self.database_loaded:
+                main.sync_qa_catalog()
+                # 피드백은 워커가 받아 qa_feedback_stats에 저장하므로 사이드카는 합계만 다시 읽음
+                main.feedback_boosts.load()
+            self.publish()
+        return {"synced_version": main.qa_catalog.synced_version}
+
+    def execute(self, op: str, params: dict):
+        if op == "sync":
+            return self.sync()
+        operation = OPERATIONS.get(op)
+        if operation is None:
+            raise ValueError(f"알 수 없는 요청입니다: {op}")
+        return operation(**params)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """연결 하나에서 요청을 차례로 처리합니다 (워커 스레드별로 연결을 재사용).
+
+        요청은 스레드 풀에서 실행하므로 (채점은 게시된 CatalogState만 읽음) 여러 연결의 요청이 동시에 처리됩니다.
+        """
+        header = main.RETRIEVAL_MESSAGE_HEADER
+        loop = asyncio.get_event_loop()
+        try:
+            while True:
+                (length,) = header.unpack(await reader.readexactly(header.size))
+                request = json.loads(await reader.readexactly(length))
+                try:
+                    result = await loop.run_in_executor(None, self.execute, request["op"], request.get("params", {}))
+                    response = {"result": result}
+                except Exception as e:
+                    logger.exception(f"요청 처리 실패: {request.get('op')}")
+                    response = {"error": str(e)}
+                body = json.dumps(response, ensure_ascii=False).encode("utf-8")
+                writer.write(header.pack(len(body)) + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def poll(self):
+        """다른 워커/관리 도구의 QA 변경을 주기적으로 반영하고 스냅샷을 갱신합니다."""
+        loop = asyncio.get_event_loop()
+        while True:
+            await asyncio.sleep(main.QA_CATALOG_POLL_INTERVAL)
+            try:
+                await loop.run_in_executor(None, self.sync)
+            except Exception as e:
+                logger.warning(f"QA 카탈로그 동기화 실패: {e}")
+
+    async def serve(self):
+        try:
+            main.init_database()
+            main.load_qa_catalog_from_db()
+            main.feedback_boosts.load()
+            self.database_loaded = True
+        except Exception as e:
+            # DB를 쓸 수 없으면 코드에 정의된 기본 QA로 동작
+            logger.error(f"QA 카탈로그 DB 로드 실패: {e}")
+        self.publish()
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        server = await asyncio.start_unix_server(self.handle, path=self.socket_path)
+        logger.info(f"검색 사이드카 시작: {self.socket_path} (공유 메모리 {self.snapshot.name})")
+        poller = asyncio.create_task(self.poll())
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            asyncio.get_running_loop().add_signal_handler(sig, stop.set)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            poller.cancel()
+            self.snapshot.unlink()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+def run():
+    parser = argparse.ArgumentParser(description="검색 사이드카 (유닉스 소켓 + 공유 메모리)")
+    parser.add_argument("--socket", default=main.RETRIEVAL_SERVICE_SOCKET, help="유닉스 소켓 경로")
+    parser.add_argument("--shared-memory", default=main.RETRIEVAL_SHARED_MEMORY, help="공유 메모리 이름")
+    args = parser.parse_args()
+
+    asyncio.run(RetrievalServer(args.socket, args.shared_memory).serve())
+    print("👋 검색 사이드카 종료")
+
+if __name__ == "__main__":
+    run()
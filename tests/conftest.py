@@ -0,0 +1,20 @@
+"""테스트 공통 설정: 외부 서비스(DB, Claude, 검색 사이드카) 없이 코드에 정의된 QA로 main을 불러옵니다."""
+
+import os
+import sys
+
+os.environ["USE_RETRIEVAL_SERVICE"] = "false"
+os.environ["CATALOG_SNAPSHOT"] = "false"
+os.environ["ANTHROPIC_API_KEY"] = ""
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+@pytest.fixture
+def client():
+    # startup 이벤트(DB 초기화)는 실행하지 않음
+    return TestClient(main.app)
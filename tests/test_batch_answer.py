@@ -0,0 +1,27 @@
+"""batch_answer.py 질문 CSV 읽기 테스트"""
+
+import pytest
+
+import batch_answer
+
+
+def write_csv(tmp_path, text):
+    path = tmp_path / "questions.csv"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_read_questions_by_column(tmp_path):
+    path = write_csv(tmp_path, "id,질문\n1,훈련장려금 언제\n2,출결 QR\n")
+    assert batch_answer.read_questions(path, "질문") == ["훈련장려금 언제", "출결 QR"]
+
+
+def test_missing_column_lists_available_columns(tmp_path):
+    path = write_csv(tmp_path, "id,질문\n1,훈련장려금 언제\n")
+    with pytest.raises(ValueError, match="id, 질문"):
+        batch_answer.read_questions(path, "question")
+
+
+def test_no_header_reads_first_column(tmp_path):
+    path = write_csv(tmp_path, "훈련장려금 언제\n출결 QR\n")
+    assert batch_answer.read_questions(path, "question", no_header=True) == ["훈련장려금 언제", "출결 QR"]
@@ -0,0 +1,56 @@
+"""컴파일된 카탈로그 스냅샷 파일 저장/복원 테스트"""
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "CATALOG_SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(main, "CATALOG_SNAPSHOT_KEY", "test-key")
+    return tmp_path
+
+
+def write_current_snapshot():
+    state = main.qa_catalog.state
+    fingerprint = main.catalog_fingerprint(main.QA_DATABASE)
+    main.write_catalog_snapshot(fingerprint, {
+        "index": state.index, "entries": state.entries, "qa_ids": state.qa_ids,
+        "similarity": state.similarity, "neighbours": main.qa_catalog.neighbour_graph(state)
+    })
+    return fingerprint
+
+
+def test_snapshot_round_trip(snapshot_dir):
+    state = main.qa_catalog.state
+    snapshot = main.read_catalog_snapshot(write_current_snapshot())
+
+    assert snapshot["qa_ids"] == state.qa_ids
+    assert snapshot["entries"] == state.entries
+    assert snapshot["index"].exact_postings == state.index.exact_postings
+    assert snapshot["index"].substring_postings == state.index.substring_postings
+    assert snapshot["index"].typo_index.deletes == state.index.typo_index.deletes
+    assert snapshot["similarity"].vocabulary == state.similarity.vocabulary
+    for field in main.NGramSimilarityModel.FIELDS:
+        for restored, compiled in zip(snapshot["similarity"].matrices[field], state.similarity.matrices[field]):
+            assert restored.dtype == compiled.dtype
+            assert (restored == compiled).all()
+
+
+def test_snapshot_with_wrong_signature_is_rejected(snapshot_dir, monkeypatch):
+    fingerprint = write_current_snapshot()
+    monkeypatch.setattr(main, "CATALOG_SNAPSHOT_KEY", "other-key")
+    assert main.read_catalog_snapshot(fingerprint) is None
+
+
+def test_snapshot_rejects_object_arrays(snapshot_dir):
+    fingerprint = write_current_snapshot()
+    path = main.catalog_snapshot_path(fingerprint)
+    with open(path, "rb") as f:
+        data = f.read()
+    assert b'"dtype": "<i8"' in data
+    # 헤더의 배열 형식을 객체 배열로 바꾸어도 역직렬화하지 않음 (헤더는 체크섬/서명 대상이 아님)
+    with open(path, "wb") as f:
+        f.write(data.replace(b'"dtype": "<i8"', b'"dtype": "|O8"', 1))
+    assert main.read_catalog_snapshot(fingerprint) is None
@@ -0,0 +1,93 @@
+"""변경 로그 동기화(sync_qa_catalog)가 번호 순서와 다르게 커밋된 변경도 반영하는지 테스트"""
+
+import copy
+
+import pytest
+
+import main
+
+
+class FakeChangeLog:
+    """qa_catalog_changes/qa_entries 두 테이블만 흉내 내는 DB 연결"""
+
+    def __init__(self):
+        self.changes = {}  # version -> qa_id (커밋되어 보이는 변경만)
+        self.entries = {}
+
+    def commit(self, version, qa_id, qa_data):
+        self.changes[version] = qa_id
+        if qa_data is None:
+            self.entries.pop(qa_id, None)
+        else:
+            self.entries[qa_id] = qa_data
+
+    def cursor(self):
+        return self
+
+    def close(self):
+        pass
+
+    def execute(self, sql, params=None):
+        if "MAX(version)" in sql:
+            self.result = [(max(self.changes, default=0),)]
+        else:
+            since_version, missing = params
+            self.result = []
+            for version in sorted(self.changes):
+                if version > since_version or version in missing:
+                    qa_id = self.changes[version]
+                    qa_data = self.entries.get(qa_id)
+                    if qa_data is None:
+                        self.result.append((version, qa_id, None, None, None))
+                    else:
+                        self.result.append((version, qa_id, qa_data["question"], qa_data["answer"], qa_data["keywords"]))
+
+    def fetchone(self):
+        return self.result[0]
+
+    def fetchall(self):
+        return self.result
+
+
+@pytest.fixture
+def change_log(monkeypatch):
+    saved = copy.deepcopy(main.QA_DATABASE)
+    log = FakeChangeLog()
+    monkeypatch.setattr(main, "get_db_connection", lambda: log)
+    main.qa_catalog.synced_version = 0
+    main.qa_catalog.missing_versions = {}
+    yield log
+    main.qa_catalog.synced_version = 0
+    main.qa_catalog.missing_versions = {}
+    main.QA_DATABASE.clear()
+    main.QA_DATABASE.update(saved)
+    main.rebuild_qa_catalog()
+    main.search_cache.clear()
+
+
+def qa(question):
+    return {"keywords": [question], "question": question, "answer": f"{question} 답변"}
+
+
+def test_late_commit_is_synced(change_log):
+    change_log.commit(1, "테스트_1", qa("첫번째"))
+    change_log.commit(3, "테스트_3", qa("세번째"))  # 2번 트랜잭션은 아직 커밋 전
+    assert main.sync_qa_catalog() == 2
+    assert main.qa_catalog.synced_version == 3
+    assert set(main.qa_catalog.missing_versions) == {2}
+
+    change_log.commit(2, "테스트_2", qa("두번째"))
+    assert main.sync_qa_catalog() == 1
+    assert "테스트_2" in main.qa_catalog.entries
+    assert main.qa_catalog.missing_versions == {}
+
+
+def test_missing_version_times_out(change_log, monkeypatch):
+    change_log.commit(2, "테스트_2", qa("두번째"))  # 1번은 롤백되어 영영 보이지 않음
+    main.sync_qa_catalog()
+    assert set(main.qa_catalog.missing_versions) == {1}
+
+    monkeypatch.setattr(main, "QA_CATALOG_GAP_TIMEOUT", -1)
+    assert main.sync_qa_catalog() == 0
+    assert main.qa_catalog.missing_versions == {}
+    assert main.qa_catalog.synced_version == 2
@@ -0,0 +1,111 @@
+"""QA 추가/수정/삭제(apply_qa_change)와 검색 중인 요청의 일관성 테스트"""
+
+import copy
+import threading
+
+import pytest
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def restore_catalog():
+    saved = copy.deepcopy(main.QA_DATABASE)
+    yield
+    main.QA_DATABASE.clear()
+    main.QA_DATABASE.update(saved)
+    main.rebuild_qa_catalog()
+    main.search_cache.clear()
+
+
+def test_delete_during_retrieve_qa():
+    analysis = main.analyze_query("훈련장려금 언제 들어오나요")
+    deleted_id = next(iter(analysis.exact_keywords))
+    main.apply_qa_change(deleted_id, None)
+
+    result = main.retrieve_qa(analysis)
+    assert result.best_id != deleted_id
+    assert deleted_id not in {r["id"] for r in result.related_questions}
+    assert deleted_id not in {r["id"] for r in result.search_results}
+
+
+def test_insert_during_retrieve_qa():
+    analysis = main.analyze_query("훈련장려금 언제 들어오나요")
+    main.apply_qa_change("테스트_신규", {
+        "keywords": ["훈련장려금", "테스트"],
+        "question": "훈련장려금 테스트 질문",
+        "answer": "테스트 답변입니다."
+    })
+    # 새 QA의 행 번호가 분석 시점의 유사도 벡터 밖이어도 다시 분석하므로 오류 없이 포함됨
+    result = main.retrieve_qa(analysis, limit=50, min_score=0)
+    assert "테스트_신규" in {r["id"] for r in result.search_results}
+
+
+def test_published_state_is_not_modified():
+    state = main.qa_catalog.state
+    exact_postings = copy.deepcopy(state.index.exact_postings)
+    substring_postings = copy.deepcopy(state.index.substring_postings)
+    typo_deletes = copy.deepcopy(state.index.typo_index.deletes)
+    patterns = set(state.index.matcher.patterns)
+    vocabulary_size = len(state.similarity.vocabulary)
+    entries = copy.deepcopy(state.entries)
+    qa_id = state.qa_ids[0]
+
+    main.apply_qa_change(qa_id, {"keywords": ["완전히새로운키워드"], "question": "바뀐 질문", "answer": "바뀐 답변"})
+    main.apply_qa_change(state.qa_ids[1], None)
+    main.apply_qa_change("테스트_신규", {"keywords": ["또다른키워드"], "question": "새 질문", "answer": "새 답변"})
+
+    assert main.qa_catalog.state is not state
+    assert state.index.exact_postings == exact_postings
+    assert state.index.substring_postings == substring_postings
+    assert state.index.typo_index.deletes == typo_deletes
+    assert state.index.matcher.patterns == patterns
+    assert len(state.similarity.vocabulary) == vocabulary_size
+    assert state.entries == entries
+    # 이전 state로도 검색이 그대로 동작해야 함
+    assert state.index.match("완전히새로운키워드") == ({}, {})
+    assert state.similarity.similarity("훈련장려금", "question").shape == (len(state.qa_ids),)
+
+
+def test_incremental_changes_match_full_rebuild():
+    main.apply_qa_change(main.qa_catalog.qa_ids[3], None)
+    main.apply_qa_change(main.qa_catalog.qa_ids[0], {
+        "keywords": ["출결", "QR"], "question": "QR 출결은 어떻게 하나요?", "answer": "앱에서 QR을 찍습니다."
+    })
+    main.apply_qa_change("테스트_신규", {"keywords": ["줌", "배경"], "question": "줌 배경 설정", "answer": "설정에서 바꿉니다."})
+
+    fresh = main.QACatalog(dict(main.QA_DATABASE))
+    for query in ["훈련장려금 언제 들어오나요", "QR 출결", "줌 배경 바꾸는 법", "훈련장러금"]:
+        incremental = main.retrieve_qa(query, limit=8, min_score=0)
+        current = main.qa_catalog
+        main.qa_catalog = fresh
+        try:
+            rebuilt = main.retrieve_qa(query, limit=8, min_score=0)
+        finally:
+            main.qa_catalog = current
+        assert incremental.related_questions == rebuilt.related_questions
+        assert incremental.search_results == rebuilt.search_results
+
+
+def test_neighbour_graph_rebuilds_in_background(monkeypatch):
+    release = threading.Event()
+    graph_class = main.QANeighbourGraph
+
+    def slow_graph(state):
+        release.wait(5)
+        return graph_class(state)
+
+    monkeypatch.setattr(main, "QANeighbourGraph", slow_graph)
+    old_graph = main.qa_catalog.neighbour_graph()
+    qa_id, deleted_id = main.qa_catalog.qa_ids[:2]
+    main.apply_qa_change(deleted_id, None)
+
+    # 다시 구성하는 동안 요청은 기다리지 않고 이전 목록을 쓰며, 삭제된 QA는 추천하지 않음
+    assert main.qa_catalog.neighbour_graph() is old_graph
+    assert deleted_id not in {r["id"] for r in main.neighbour_related_questions(qa_id, set(), 10)}
+
+    rebuild = main.qa_catalog.neighbour_rebuild
+    release.set()
+    rebuild.join(5)
+    assert main.qa_catalog.neighbour_graph().version == main.qa_catalog.version
+    assert main.qa_catalog.neighbour_rebuild is None
@@ -0,0 +1,26 @@
+"""/ws/chat 턴 처리 오류 테스트"""
+
+from fastapi import HTTPException
+
+import main
+
+
+def test_websocket_turn_error_keeps_connection(client, monkeypatch):
+    def failing_retrieve_qa(*args, **kwargs):
+        raise HTTPException(status_code=503, detail="검색 서비스에 연결할 수 없습니다.")
+
+    with client.websocket_connect("/ws/chat") as websocket:
+        assert websocket.receive_json()["type"] == "session"
+
+        with monkeypatch.context() as patch:
+            patch.setattr(main, "retrieve_qa", failing_retrieve_qa)
+            websocket.send_json({"prompt": "훈련장려금 언제 들어와요", "use_claude": False})
+            assert websocket.receive_json() == {"type": "error", "detail": "검색 서비스에 연결할 수 없습니다."}
+
+        # 같은 연결로 다음 턴을 계속 처리
+        websocket.send_json({"prompt": "훈련장려금 언제 들어와요", "use_claude": False})
+        events = [websocket.receive_json()]
+        while events[-1]["type"] not in ("done", "error"):
+            events.append(websocket.receive_json())
+        assert events[0]["type"] == "meta"
+        assert events[-1]["type"] == "done"
@@ -0,0 +1,66 @@
+"""/feedback 제출이 QA별 피드백 집계에 반영되는 조건 테스트"""
+
+import pytest
+
+import main
+
+
+class FakeMessages:
+    """messages 조회만 흉내 내는 DB 연결 (답변 메시지 하나)"""
+
+    def __init__(self, qa_id):
+        self.qa_id = qa_id
+
+    def cursor(self):
+        return self
+
+    def close(self):
+        pass
+
+    def execute(self, sql, params=None):
+        self.row = ("답변 내용", self.qa_id) if "qa_id FROM messages" in sql else ("질문 내용",)
+
+    def fetchone(self):
+        return self.row
+
+
+@pytest.fixture
+def feedback(client, monkeypatch):
+    recorded, saved = [], []
+
+    def submit(message_qa_id, already_counted=False, **body):
+        monkeypatch.setattr(main, "get_db_connection", lambda: FakeMessages(message_qa_id))
+
+        def save_answer_feedback(count_vote=False, **kwargs):
+            saved.append(count_vote)
+            return count_vote and not already_counted
+
+        monkeypatch.setattr(main, "save_answer_feedback", save_answer_feedback)
+        monkeypatch.setattr(main.feedback_boosts, "record", lambda qa_id, feedback_type: recorded.append((qa_id, feedback_type)))
+        return client.post("/feedback", json={
+            "session_id": "s", "message_id": "m", "feedback_type": "positive", **body
+        })
+
+    submit.recorded, submit.saved = recorded, saved
+    return submit
+
+
+def test_feedback_credits_message_qa_only(feedback):
+    qa_id, other_id = main.qa_catalog.qa_ids[:2]
+    response = feedback(qa_id, qa_id=other_id)
+    assert response.status_code == 200
+    assert feedback.recorded == [(qa_id, "positive")]
+
+
+def test_feedback_for_unknown_qa_is_not_counted(feedback):
+    assert feedback("없는_QA").status_code == 200
+    assert feedback(None).status_code == 200
+    assert feedback.saved == [False, False]
+    assert feedback.recorded == []
+
+
+def test_feedback_counts_once_per_message(feedback):
+    qa_id = main.qa_catalog.qa_ids[0]
+    assert feedback(qa_id, already_counted=True).status_code == 200
+    assert feedback.saved == [True]
+    assert feedback.recorded == []
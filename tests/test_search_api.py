@@ -0,0 +1,70 @@
+"""/search, /search/batch 요청 검증 테스트"""
+
+import json
+
+import pytest
+
+import main
+
+
+def test_batch_search_rejects_null_min_score(client):
+    response = client.post("/search/batch", json={"queries": ["훈련장려금"], "min_score": None})
+    assert response.status_code == 422
+
+
+def test_batch_search_rejects_null_limit(client):
+    response = client.post("/search/batch", json={"queries": ["훈련장려금"], "limit": None})
+    assert response.status_code == 422
+
+
+def test_batch_search_defaults(client):
+    response = client.post("/search/batch", json={"queries": ["훈련장려금"]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["min_score"] == 0.1
+    assert body["results"][0]["results"]
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_search_rejects_non_positive_limit(client, limit):
+    response = client.get("/search", params={"query": "훈련장려금", "limit": limit})
+    assert response.status_code == 422
+
+
+def test_search_cursor_pages_through_results(client):
+    params = {"query": "훈련장려금", "limit": 1, "min_score": 0}
+    seen = []
+    response = client.get("/search", params=params).json()
+    while True:
+        seen += [r["id"] for r in response["results"]]
+        if response["next_cursor"] is None:
+            break
+        response = client.get("/search", params={**params, "cursor": response["next_cursor"]}).json()
+    assert len(seen) == len(set(seen)) == response["total_found"]
+
+
+@pytest.mark.parametrize("changed", [{"query": "출결"}, {"min_score": 0.5}])
+def test_search_cursor_is_tied_to_query(client, changed):
+    params = {"query": "훈련장려금", "limit": 1, "min_score": 0}
+    next_cursor = client.get("/search", params=params).json()["next_cursor"]
+    assert next_cursor is not None
+    response = client.get("/search", params={**params, **changed, "cursor": next_cursor})
+    assert response.status_code == 400
+
+
+def test_search_stream_matches_json_and_records_query(client, monkeypatch):
+    recorded = []
+    monkeypatch.setattr(main.suggestion_index, "record_query", lambda query, client: recorded.append(query))
+    params = {"query": "훈련장려금", "limit": 3}
+    body = client.get("/search", params=params).json()
+
+    response = client.get("/search", params={**params, "stream": "true"})
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0]["type"] == "meta"
+    assert lines[1:-1] == [{"type": "result", **r} for r in body["results"]]
+    end = lines[-1]
+    assert end["type"] == "end"
+    assert end["total_found"] == body["total_found"]
+    assert end["related_questions"] == body["related_questions"]
+    assert end["next_cursor"] == body["next_cursor"]
+    assert recorded == ["훈련장려금", "훈련장려금"]
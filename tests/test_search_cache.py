@@ -0,0 +1,35 @@
+"""검색 결과 캐시 테스트"""
+
+import main
+
+
+def test_cached_search_results_are_not_shared():
+    main.search_cache.clear()
+    first = main.search_qa_cached("훈련장려금", 0.1)
+    expected = [dict(result, keywords=list(result["keywords"])) for result in first]
+    # 호출하는 쪽이 결과를 고쳐도 다음 캐시 적중 결과는 그대로여야 함
+    first[0]["score"] = -1
+    first[0]["keywords"].append("변경됨")
+    first.clear()
+    second = main.search_qa_cached("훈련장려금", 0.1)
+    assert second == expected
+    second[0]["matched_keywords"].append("변경됨")
+    assert main.search_qa_cached("훈련장려금", 0.1) == expected
+
+
+def test_cached_related_questions_are_not_shared():
+    main.search_cache.clear()
+    first = main.find_related_questions_smart("출결 QR 체크")
+    expected = [dict(question, relevance_factors=list(question["relevance_factors"])) for question in first]
+    first[0]["relevance_factors"].append("변경됨")
+    first[0]["question"] = ""
+    assert main.find_related_questions_smart("출결 QR 체크") == expected
+
+
+def test_search_results_do_not_share_catalog_keywords():
+    main.search_cache.clear()
+    results = main.search_qa_cached("훈련장려금", 0.1)
+    entry = main.qa_catalog.entries[results[0]["id"]]
+    keywords = list(entry["keywords"])
+    results[0]["keywords"].append("변경됨")
+    assert entry["keywords"] == keywords
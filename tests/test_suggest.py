@@ -0,0 +1,29 @@
+"""인기 검색어 자동완성 집계 테스트"""
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def suggestion_index(monkeypatch):
+    index = main.SuggestionIndex()
+    monkeypatch.setattr(main, "suggestion_index", index)
+    return index
+
+
+def popular_texts(index, prefix):
+    return [s["text"] for s in index.suggest(prefix) if s["type"] == "popular"]
+
+
+def test_single_client_cannot_add_popular_query(suggestion_index):
+    for _ in range(20):
+        suggestion_index.record_query("훈련장려금 광고문구", "10.0.0.1")
+    assert popular_texts(suggestion_index, "훈련장려금") == []
+
+
+def test_popular_query_needs_distinct_clients(suggestion_index):
+    for n in range(main.SuggestionTrie.MIN_POPULAR_CLIENTS):
+        assert popular_texts(suggestion_index, "훈련장려금") == []
+        suggestion_index.record_query("훈련장려금 지급일", f"10.0.0.{n}")
+    assert popular_texts(suggestion_index, "훈련장려금") == ["훈련장려금 지급일"]